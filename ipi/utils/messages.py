@@ -9,6 +9,7 @@ import traceback
 import sys
 import os
 import time
+from functools import lru_cache
 from ipi import __version__
 
 __all__ = [
@@ -34,37 +35,26 @@ class Verbosity(object):
 
     Attributes:
         level: Determines what level of output to print.
+        quiet, low, medium, high, debug, trace: Whether the current level
+            is greater than or equal to the named one, used to decide
+            whether or not a certain info or warning string should be output.
     """
 
     lock = False
     level = VERB_LOW
+    _levels = {
+        "quiet": VERB_QUIET,
+        "low": VERB_LOW,
+        "medium": VERB_MEDIUM,
+        "high": VERB_HIGH,
+        "debug": VERB_DEBUG,
+        "trace": VERB_TRACE,
+    }
 
-    def __getattr__(self, name):
-        """Determines whether a certain verbosity level is
-        less than or greater than the stored value.
+    def __init__(self):
+        """Initialises the level flags to the default verbosity level."""
 
-        Used to decide whether or not a certain info or warning string
-        should be output.
-
-        Args:
-            name: The verbosity level at which the info/warning string
-                will be output.
-        """
-
-        if name == "quiet":
-            return self.level >= VERB_QUIET
-        elif name == "low":
-            return self.level >= VERB_LOW
-        elif name == "medium":
-            return self.level >= VERB_MEDIUM
-        elif name == "high":
-            return self.level >= VERB_HIGH
-        elif name == "debug":
-            return self.level >= VERB_DEBUG
-        elif name == "trace":
-            return self.level >= VERB_TRACE
-        else:
-            return super(Verbosity, self).__getattr__(name)
+        self.level = "low"
 
     def __setattr__(self, name, value):
         """Sets the verbosity level
@@ -82,23 +72,17 @@ class Verbosity(object):
             if self.lock:
                 # do not set the verbosity level if this is locked
                 return
-            if value == "quiet":
-                level = VERB_QUIET
-            elif value == "low":
-                level = VERB_LOW
-            elif value == "medium":
-                level = VERB_MEDIUM
-            elif value == "high":
-                level = VERB_HIGH
-            elif value == "debug":
-                level = VERB_DEBUG
-            elif value == "trace":
-                level = VERB_TRACE
-            else:
+            try:
+                level = self._levels[value]
+            except (KeyError, TypeError):
                 raise ValueError(
                     "Invalid verbosity level " + str(value) + " specified."
                 )
             super(Verbosity, self).__setattr__("level", level)
+            # stores one flag per level, so that checks such as
+            # verbosity.high are plain attribute reads
+            for flag, threshold in self._levels.items():
+                super(Verbosity, self).__setattr__(flag, level >= threshold)
         else:
             super(Verbosity, self).__setattr__(name, value)
 
@@ -106,6 +90,7 @@ class Verbosity(object):
 verbosity = Verbosity()
 
 
+@lru_cache(maxsize=1)
 def get_git_info():
     """
     Retrieves information about the current Git repository, including the branch name,
@@ -120,6 +105,9 @@ def get_git_info():
             - 'remote_url' (str): The URL of the remote repository. Defaults to 'unknown' if not found.
 
         None: If the Git directory is not found or if required information cannot be retrieved.
+
+    The result is cached, since the repository state is not expected to change
+    during a run.
     """
 
     base_path = os.path.abspath(os.path.join(__file__, "..", "..", "..")) + "/"
@@ -127,6 +115,21 @@ def get_git_info():
     if not os.path.isdir(git_dir):
         return None
 
+    return read_git_info(git_dir)
+
+
+def read_git_info(git_dir):
+    """
+    Reads the branch name, last commit hash and remote URL directly from the
+    files of a Git directory, without calling git.
+
+    Args:
+        git_dir: The path to the '.git' directory of the repository.
+
+    Returns:
+        dict: The same dictionary as `get_git_info`, or None if HEAD cannot be read.
+    """
+
     def read_git_file(filepath):
         """Reads and returns the content of a Git-related file."""
         try:
@@ -147,9 +150,19 @@ def get_git_info():
     # Parse the current branch name
     try:
         if head_content.startswith("ref:"):
-            ref_path = os.path.join(git_dir, head_content.split(" ")[1])
+            ref_name = head_content.split(" ")[1]
+            ref_path = os.path.join(git_dir, ref_name)
             branch_name = os.path.basename(ref_path)
             last_commit = read_git_file(ref_path)
+            if last_commit is None:
+                # The ref may have been packed (e.g. by 'git gc')
+                packed_refs = read_git_file(os.path.join(git_dir, "packed-refs"))
+                for line in (packed_refs or "").splitlines():
+                    if line.endswith(" " + ref_name):
+                        last_commit = line.split(" ")[0]
+                        break
+                else:
+                    last_commit = "unknown"
         else:
             # Detached HEAD state
             branch_name = "DETACHED"
@@ -158,15 +171,28 @@ def get_git_info():
         pass
 
     try:
-        # Get remote URL from the config file
-        config_path = os.path.join(git_dir, "config")
-        # remote_url = None
-        if os.path.exists(config_path):
-            with open(config_path, "r") as config_file:
-                for line in config_file:
-                    if line.strip().startswith("url ="):
-                        remote_url = line.split("=")[1].strip()
-                        break
+        # Get remote URL from the config file, preferring 'origin' over
+        # whichever remote happens to be listed first. Scans the lines
+        # directly, since git ignores indentation and allows keys without
+        # a value, which a generic INI parser does not.
+        remote_urls = {}
+        section = ""
+        with open(os.path.join(git_dir, "config"), "r") as config_file:
+            for line in config_file:
+                line = line.strip()
+                if line.startswith("["):
+                    section = line
+                    continue
+                key, _, value = line.partition("=")
+                if section.startswith("[remote ") and key.strip() == "url":
+                    # drop trailing comments
+                    value = value.split("#")[0].split(";")[0].strip()
+                    if value:
+                        remote_urls.setdefault(section, value)
+        if remote_urls:
+            remote_url = remote_urls.get(
+                '[remote "origin"]', next(iter(remote_urls.values()))
+            )
     except:
         pass
 
@@ -178,6 +204,24 @@ def get_git_info():
     }
 
 
+@lru_cache(maxsize=1)
+def get_machine_name():
+    """
+    Returns the hostname of the machine, or 'Unknown' if it cannot be
+    determined. The result is cached.
+    """
+
+    try:
+        # a single uname call, which also works where /etc/hostname is missing
+        machine_name = os.uname().nodename
+    except AttributeError:
+        # os.uname is not available on Windows
+        import platform
+
+        machine_name = platform.node()
+    return machine_name or "Unknown"
+
+
 def get_system_info():
     """
     Collects and returns basic system information including the current working directory,
@@ -185,9 +229,9 @@ def get_system_info():
 
     Returns:
         dict: A dictionary containing:
-            - 'current_folder' (str): The current working directory path.
-            - 'working_directory' (str): The hostname of the machine, read from '/etc/hostname'.
-              If the file is not found, returns 'Unknown'.
+            - 'machine_name' (str): The hostname of the machine, or 'Unknown'
+              if it cannot be determined.
+            - 'working_directory' (str): The current working directory path.
             - 'datetime' (str): The current date and time formatted as 'YYYY-MM-DD HH:MM:SS'.
     """
 
@@ -195,11 +239,7 @@ def get_system_info():
     working_directory = os.getcwd()
 
     # Get the machine name (hostname)
-    try:
-        with open("/etc/hostname", "r") as file:
-            machine_name = file.read().strip()
-    except FileNotFoundError:
-        machine_name = "Unknown"  # Fallback in case the file is not found
+    machine_name = get_machine_name()
 
     # Get the current time as a struct_time object
     current_time = time.localtime()
@@ -237,42 +277,40 @@ def get_identification_info():
     # Retrieve system information using another helper function
     system_info = get_system_info()
 
-    # Initialize the string that will hold all formatted information
-    info_string = ""
+    # Collect the formatted lines, which are joined at the end
+    info_lines = []
 
     # Format and add Git information if it is successfully retrieved
     if git_info:
-        info_string += "# Git information:\n"
-        info_string += f"#    i-PI version: {git_info['version']}\n"
-        info_string += f"#      Remote URL: {git_info['remote_url']:<24}\n"
-        info_string += f"#          Branch: {git_info['branch_name']:<24}\n"
-        info_string += f"#     Last Commit: {git_info['last_commit']:<24}\n"
+        info_lines.append("# Git information:\n")
+        info_lines.append(f"#    i-PI version: {git_info['version']}\n")
+        info_lines.append(f"#      Remote URL: {git_info['remote_url']:<24}\n")
+        info_lines.append(f"#          Branch: {git_info['branch_name']:<24}\n")
+        info_lines.append(f"#     Last Commit: {git_info['last_commit']:<24}\n")
     else:
         # Inform the user if Git information could not be retrieved
-        info_string += "# Unable to retrieve Git information.\n"
+        info_lines.append("# Unable to retrieve Git information.\n")
 
     # Add a separator line for clarity between Git and system information
-    info_string += "#\n"
+    info_lines.append("#\n")
 
     # Format and add system information if it is successfully retrieved
     if system_info:
-        info_string += "# Simulation information:\n"
-        info_string += f"#           Machine Name: {system_info['machine_name']}\n"
-        info_string += f"#      Working Directory: {system_info['working_directory']}\n"
-        info_string += f"#          Date and Time: {system_info['datetime']}\n"
+        info_lines.append("# Simulation information:\n")
+        info_lines.append(f"#           Machine Name: {system_info['machine_name']}\n")
+        info_lines.append(
+            f"#      Working Directory: {system_info['working_directory']}\n"
+        )
+        info_lines.append(f"#          Date and Time: {system_info['datetime']}\n")
     else:
         # Inform the user if system information could not be retrieved
-        info_string += "# Unable to retrieve simulation information.\n"
+        info_lines.append("# Unable to retrieve simulation information.\n")
 
     # Return the final formatted string
-    return info_string
+    return "".join(info_lines)
 
 
-def banner():
-    """Prints out a banner."""
-
-    print(
-        rf"""
+_BANNER = rf"""
  ____       ____       ____       ____
 /    \     /    \     /    \     /    \
 |  #################################  |
@@ -289,7 +327,12 @@ def banner():
 \____/     \____/     \____/     \____/
 
     """
-    )
+
+
+def banner():
+    """Prints out a banner."""
+
+    print(_BANNER)
 
     info_string = get_identification_info()
     print(info_string)
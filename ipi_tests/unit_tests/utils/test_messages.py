@@ -0,0 +1,125 @@
+"""Tests the verbosity handling and Git information in the messages module."""
+
+# This file is part of i-PI.
+# i-PI Copyright (C) 2014-2015 i-PI developers
+# See the "licenses" directory for full license information.
+
+
+import pytest
+
+from ipi.utils.messages import Verbosity, read_git_info
+
+
+def test_default_level():
+    verb = Verbosity()
+    assert verb.quiet and verb.low
+    assert not (verb.medium or verb.high or verb.debug or verb.trace)
+
+
+def test_set_level():
+    verb = Verbosity()
+    verb.level = "high"
+    assert verb.medium and verb.high
+    assert not (verb.debug or verb.trace)
+    verb.level = "quiet"
+    assert verb.quiet
+    assert not verb.low
+
+
+def test_lock():
+    verb = Verbosity()
+    verb.level = "debug"
+    verb.lock = True
+    verb.level = "quiet"
+    assert verb.debug
+
+
+def test_invalid_level():
+    verb = Verbosity()
+    with pytest.raises(ValueError):
+        verb.level = "loud"
+
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+def make_git_dir(path, config=""):
+    git_dir = path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "config").write_text(config)
+    return git_dir
+
+
+def test_git_loose_ref(tmp_path):
+    git_dir = make_git_dir(tmp_path)
+    (git_dir / "refs" / "heads" / "main").write_text(COMMIT + "\n")
+    info = read_git_info(str(git_dir))
+    assert info["branch_name"] == "main"
+    assert info["last_commit"] == COMMIT
+
+
+def test_git_packed_ref(tmp_path):
+    git_dir = make_git_dir(tmp_path)
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        "fedcba9876543210fedcba9876543210fedcba98 refs/heads/other\n"
+        f"{COMMIT} refs/heads/main\n"
+    )
+    info = read_git_info(str(git_dir))
+    assert info["branch_name"] == "main"
+    assert info["last_commit"] == COMMIT
+
+
+def test_git_missing_ref(tmp_path):
+    git_dir = make_git_dir(tmp_path)
+    info = read_git_info(str(git_dir))
+    assert info["last_commit"] == "unknown"
+
+
+def test_git_remote_prefers_origin(tmp_path):
+    git_dir = make_git_dir(
+        tmp_path,
+        '[remote "upstream"]\n'
+        "\turl = https://example.com/upstream.git\n"
+        '[remote "origin"]\n'
+        "\turl = https://example.com/origin.git\n",
+    )
+    info = read_git_info(str(git_dir))
+    assert info["remote_url"] == "https://example.com/origin.git"
+
+
+def test_git_config_valueless_key(tmp_path):
+    git_dir = make_git_dir(
+        tmp_path,
+        "[core]\n"
+        "\tfilemode\n"
+        '[remote "origin"]\n'
+        "\turl = https://example.com/origin.git # a comment\n",
+    )
+    info = read_git_info(str(git_dir))
+    assert info["remote_url"] == "https://example.com/origin.git"
+
+
+def test_git_config_mixed_indent(tmp_path):
+    git_dir = make_git_dir(
+        tmp_path,
+        '[remote "origin"]\n'
+        "url = https://example.com/origin.git\n"
+        "    fetch = +refs/heads/*:refs/remotes/origin/*\n",
+    )
+    info = read_git_info(str(git_dir))
+    assert info["remote_url"] == "https://example.com/origin.git"
+
+
+def test_git_config_valueless_then_indented(tmp_path):
+    git_dir = make_git_dir(
+        tmp_path,
+        "[core]\n"
+        "filemode\n"
+        "\tbare = false\n"
+        '[remote "origin"]\n'
+        "\turl = https://example.com/origin.git\n",
+    )
+    info = read_git_info(str(git_dir))
+    assert info["remote_url"] == "https://example.com/origin.git"